@@ -7,12 +7,15 @@ https://tech.yandex.com/weather/
 
 import asyncio
 import logging
+import operator
 import socket
 
 import aiohttp
-import async_timeout
+import msgspec
 
+from aiohttp import hdrs
 from datetime import timedelta
+from http import HTTPStatus
 
 import voluptuous as vol
 import homeassistant.util.dt as dt_util
@@ -26,6 +29,7 @@ from homeassistant.const import (
     CONF_API_KEY,
     CONF_LATITUDE,
     CONF_LONGITUDE,
+    EVENT_HOMEASSISTANT_CLOSE,
 )
 
 from homeassistant.components.weather import (
@@ -42,7 +46,6 @@ from homeassistant.components.weather import (
     WeatherEntity,
 )
 
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.util import Throttle
 
 import homeassistant.helpers.config_validation as cv
@@ -50,9 +53,9 @@ import homeassistant.helpers.config_validation as cv
 
 _LOGGER = logging.getLogger(__name__)
 
-TIME_STR_FORMAT = "%H:%M %d.%m.%Y"
 DEFAULT_NAME = "Yandex Weather"
 ATTRIBUTION = "Data provided by Yandex.Weather"
+API_URL = "https://api.weather.yandex.ru"
 
 ATTR_FEELS_LIKE_TEMP = "feels_like"
 ATTR_WEATHER_ICON = "weather_icon"
@@ -74,7 +77,74 @@ CONDITION_CLASSES = {
     "snowy": ["light-snow", "snow", "snow-showers"],
 }
 
+_CONDITION_MAP = {v: k for k, vs in CONDITION_CLASSES.items() for v in vs}
+
 MIN_TIME_BETWEEN_UPDATES = timedelta(minutes=45)
+_FORECAST_OFFSETS = (timedelta(minutes=350), timedelta(minutes=700))
+_FORECAST_FIELDS = (
+    (ATTR_FORECAST_NATIVE_TEMP, "temp_max"),
+    (ATTR_FORECAST_NATIVE_TEMP_LOW, "temp_min"),
+    (ATTR_WEATHER_ICON, "icon"),
+    (ATTR_FEELS_LIKE_TEMP, "feels_like"),
+    (ATTR_PRECIPITATION_PROB, "prec_prob"),
+    (ATTR_FORECAST_NATIVE_WIND_SPEED, "wind_speed"),
+    (ATTR_FORECAST_WIND_BEARING, "wind_dir"),
+    (ATTR_FORECAST_NATIVE_PRECIPITATION, "prec_mm"),
+    (ATTR_FORECAST_NATIVE_PRESSURE, "pressure_pa"),
+    (ATTR_WEATHER_HUMIDITY, "humidity"),
+    ("part_of_day", "part_name"),
+)
+_FORECAST_KEYS = tuple(dst for dst, _ in _FORECAST_FIELDS)
+_forecast_values = operator.attrgetter(*(src for _, src in _FORECAST_FIELDS))
+
+
+class Fact(msgspec.Struct):
+    """Current weather conditions."""
+
+    temp: int | float | None = None
+    humidity: int | float | None = None
+    wind_speed: int | float | None = None
+    wind_dir: str | None = None
+    pressure_pa: int | float | None = None
+    condition: str | None = None
+    icon: str | None = None
+    feels_like: int | float | None = None
+    obs_time: int | float | None = None
+
+
+class Part(msgspec.Struct):
+    """Forecast for a part of the day."""
+
+    part_name: str | None = None
+    temp_min: int | float | None = None
+    temp_max: int | float | None = None
+    feels_like: int | float | None = None
+    condition: str | None = None
+    icon: str | None = None
+    wind_speed: int | float | None = None
+    wind_dir: str | None = None
+    pressure_pa: int | float | None = None
+    humidity: int | float | None = None
+    prec_mm: int | float | None = None
+    prec_prob: int | float | None = None
+
+
+class Forecast(msgspec.Struct):
+    """Forecast section of the informers response."""
+
+    parts: list[Part] | None = None
+
+
+class Response(msgspec.Struct):
+    """Informers response, status and message are only set on errors."""
+
+    fact: Fact | None = None
+    forecast: Forecast | None = None
+    status: int | str | None = None
+    message: str | None = None
+
+
+_decoder = msgspec.json.Decoder(Response)
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
@@ -87,10 +157,7 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 
 
 def get_condition(data):
-    return next(
-        (k for k, v in CONDITION_CLASSES.items() if data.get("condition") in v),
-        None,
-    )
+    return _CONDITION_MAP.get(data.condition)
 
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
@@ -99,17 +166,15 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     latitude = config.get(CONF_LATITUDE, hass.config.latitude)
     name = config.get(CONF_NAME)
     api_key = config.get(CONF_API_KEY)
-    session = async_get_clientsession(hass)
 
-    async_add_entities(
-        [YandexWeather(name, longitude, latitude, api_key, session)], True
-    )
+    async_add_entities([YandexWeather(name, longitude, latitude, api_key)])
 
 
 class YandexWeather(WeatherEntity):
     """Representation of a weather entity."""
 
     _attr_attribution = ATTRIBUTION
+    _attr_available = False
     _attr_should_poll = False
 
     _attr_native_temperature_unit = UnitOfTemperature.CELSIUS
@@ -117,128 +182,128 @@ class YandexWeather(WeatherEntity):
     _attr_native_wind_speed_unit = UnitOfSpeed.METERS_PER_SECOND
     _attr_native_precipitation_unit = UnitOfPrecipitationDepth.MILLIMETERS
 
-    def __init__(self, name: str, longitude: str, latitude: str, api_key: str, session):
+    def __init__(self, name: str, longitude: str, latitude: str, api_key: str):
         self._longitude = longitude
         self._latitude = latitude
         self._api_key = api_key
-        self._session = session
+        self._session = None
+        self._weather_data = None
 
         self._attr_name = name
         self._attr_unique_id = f"{name}_{longitude}_{latitude}"
 
+        self._current = None
+        self._forecast = None
+        self._forecast_entries = None
+        self._cached_forecast = None
+        self._observation_time = None
+
+    async def async_added_to_hass(self):
+        """Open the dedicated API session and schedule the first update."""
+        connector = aiohttp.TCPConnector(
+            limit_per_host=2, keepalive_timeout=3600, ttl_dns_cache=3600
+        )
+        self._session = aiohttp.ClientSession(
+            base_url=API_URL,
+            connector=connector,
+            headers={"X-Yandex-API-Key": self._api_key},
+        )
         self._weather_data = YandexWeatherApi(
             self._latitude,
             self._longitude,
-            self._api_key,
             session=self._session,
         )
 
+        self.async_on_remove(
+            self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, self._async_close_session
+            )
+        )
+        self.async_schedule_update_ha_state(True)
+
+    async def async_will_remove_from_hass(self):
+        """Close the dedicated API session."""
+        await self._async_close_session()
+
+    async def _async_close_session(self, event=None):
+        """Close the dedicated API session."""
+        await self._session.close()
+
     @Throttle(MIN_TIME_BETWEEN_UPDATES)
     async def async_update(self):
         """Get the latest weather information."""
-        await self._weather_data.get_weather()
-
-    @property
-    def native_temperature(self) -> float | None:
-        """Return the temperature."""
-        if self._weather_data.current is not None:
-            return self._weather_data.current.get("temp")
-        return None
-
-    @property
-    def humidity(self) -> float | None:
-        """Return the humidity."""
-        if self._weather_data.current is not None:
-            return self._weather_data.current.get("humidity")
-        return None
+        if await self._weather_data.get_weather():
+            self._update_from_api()
+
+        self._cached_forecast = self._stamp_forecast()
+
+    def _update_from_api(self):
+        """Cache the latest current conditions and forecast entries."""
+        self._current = current = self._weather_data.current
+        self._forecast = self._weather_data.forecast
+        self._attr_available = current is not None
+        if current is not None:
+            self._attr_native_temperature = current.temp
+            self._attr_humidity = current.humidity
+            self._attr_native_wind_speed = current.wind_speed
+            self._attr_wind_bearing = current.wind_dir
+            self._attr_native_pressure = current.pressure_pa
+            self._attr_condition = get_condition(current)
+
+            obs_time = current.obs_time
+            if obs_time is not None:
+                dt = dt_util.as_local(dt_util.utc_from_timestamp(obs_time))
+                self._observation_time = (
+                    f"{dt.hour:02d}:{dt.minute:02d} "
+                    f"{dt.day:02d}.{dt.month:02d}.{dt.year}"
+                )
+            else:
+                self._observation_time = None
 
-    @property
-    def native_wind_speed(self) -> float | None:
-        """Return the wind speed."""
-        if self._weather_data.current is not None:
-            return self._weather_data.current.get("wind_speed")
-        return None
+        self._forecast_entries = self._build_forecast()
 
-    @property
-    def wind_bearing(self) -> float | str | None:
-        """Return the wind bearing."""
-        if self._weather_data.current is not None:
-            return self._weather_data.current.get("wind_dir")
-        return None
+    def _build_forecast(self):
+        """Build the forecast entries from the latest forecast parts."""
+        if self._forecast is not None:
+            fcdata_out = []
+            for data_in in self._forecast:
+                data_out = dict(zip(_FORECAST_KEYS, _forecast_values(data_in)))
+                data_out[ATTR_FORECAST_CONDITION] = get_condition(data_in)
+                fcdata_out.append(data_out)
 
-    @property
-    def native_pressure(self) -> float | None:
-        """Return the pressure."""
-        if self._weather_data.current is not None:
-            return self._weather_data.current.get("pressure_pa")
-        return None
+            return fcdata_out
 
-    @property
-    def condition(self) -> str | None:
-        """Return the weather condition"""
-        if self._weather_data.current is not None:
-            return get_condition(self._weather_data.current)
-        return None
+    def _stamp_forecast(self):
+        """Return the forecast array with times relative to now."""
+        entries = self._forecast_entries
+        if entries is not None:
+            now = dt_util.utcnow()
+            stamped = [
+                {**data_out, ATTR_FORECAST_TIME: now + offset}
+                for data_out, offset in zip(entries, _FORECAST_OFFSETS)
+            ]
+            return stamped + entries[len(_FORECAST_OFFSETS) :]
 
     @property
     def condition_icon(self) -> int:
         """Return the weather condition icon"""
-        if self._weather_data.current is not None:
-            return self._weather_data.current.get("icon")
-        return None
+        c = self._current
+        return c.icon if c else None
 
     @property
     def forecast(self):
         """Return the forecast array."""
-        if self._weather_data.forecast is not None:
-            fcdata_out = []
-            fc_array = self._weather_data.forecast.get("parts", [])
-            for data_in in fc_array:
-                data_out = {}
-
-                if list(fc_array).index(data_in) == 0:
-                    data_out[ATTR_FORECAST_TIME] = dt_util.utcnow() + timedelta(
-                        minutes=350
-                    )
-                if list(fc_array).index(data_in) == 1:
-                    data_out[ATTR_FORECAST_TIME] = dt_util.utcnow() + timedelta(
-                        minutes=700
-                    )
-
-                data_out[ATTR_FORECAST_NATIVE_TEMP] = data_in.get("temp_max")
-                data_out[ATTR_FORECAST_NATIVE_TEMP_LOW] = data_in.get("temp_min")
-                data_out[ATTR_FORECAST_CONDITION] = get_condition(data_in)
-
-                data_out[ATTR_WEATHER_ICON] = data_in.get("icon")
-                data_out[ATTR_FEELS_LIKE_TEMP] = data_in.get("feels_like")
-                data_out[ATTR_PRECIPITATION_PROB] = data_in.get("prec_prob")
-
-                data_out[ATTR_FORECAST_NATIVE_WIND_SPEED] = data_in.get("wind_speed")
-                data_out[ATTR_FORECAST_WIND_BEARING] = data_in.get("wind_dir")
-                data_out[ATTR_FORECAST_NATIVE_PRECIPITATION] = data_in.get("prec_mm")
-                data_out[ATTR_FORECAST_NATIVE_PRESSURE] = data_in.get("pressure_pa")
-                data_out[ATTR_WEATHER_HUMIDITY] = data_in.get("humidity")
-
-                data_out["part_of_day"] = data_in.get("part_name")
-                fcdata_out.append(data_out)
-
-            return fcdata_out
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._weather_data.current is not None
+        return self._cached_forecast
 
     @property
     def device_state_attributes(self):
         """Return device specific state attributes."""
-        if self._weather_data.current is not None:
+        c = self._current
+        if c:
             data = dict()
-            data[ATTR_FEELS_LIKE_TEMP] = self._weather_data.current.get("feels_like")
-            data[ATTR_WEATHER_ICON] = self._weather_data.current.get("icon")
-            data[ATTR_OBSERVATION_TIME] = dt_util.as_local(
-                dt_util.utc_from_timestamp(self._weather_data.current.get("obs_time"))
-            ).strftime(TIME_STR_FORMAT)
+            data[ATTR_FEELS_LIKE_TEMP] = c.feels_like
+            data[ATTR_WEATHER_ICON] = c.icon
+            data[ATTR_OBSERVATION_TIME] = self._observation_time
             return data
 
         return None
@@ -247,44 +312,61 @@ class YandexWeather(WeatherEntity):
 class YandexWeatherApi(object):
     """A class for returning Yandex Weather data."""
 
-    def __init__(self, lat: str, lon: str, api_key, session="none"):
+    def __init__(self, lat: str, lon: str, session="none"):
         """Initialize the class."""
-        self._api = api_key
-        self._lat = lat
-        self._lon = lon
         self._session = session
+        self._url = f"/v2/informers?lat={lat}&lon={lon}"
+        self._timeout = aiohttp.ClientTimeout(
+            total=5, connect=2, sock_connect=2, sock_read=3
+        )
 
         self._current = None
         self._forecast = None
+        self._etag = None
 
-    async def get_weather(self):
-        base_url = f"https://api.weather.yandex.ru/v2/informers?lat={self._lat}&lon={self._lon}"
-        headers = {"X-Yandex-API-Key": self._api}
+    async def get_weather(self) -> bool:
+        """Fetch the latest weather data, return True if it has changed."""
+        headers = {hdrs.IF_NONE_MATCH: self._etag} if self._etag else None
 
         try:
-            async with async_timeout.timeout(5):
-                response = await self._session.get(base_url, headers=headers)
-
-            data = await response.json()
-
-            if "status" not in data:
-                self._current = data["fact"] if "fact" in data else None
-                self._forecast = data["forecast"] if "forecast" in data else None
-                _LOGGER.debug(f"Current data:{self._current}")
-                _LOGGER.debug(f"Forecast data:{self._forecast}")
-            else:
-                _LOGGER.error(
-                    "Error fetching data from Yandex.Weather, %s, %s",
-                    data["status"],
-                    data["message"],
-                )
-
+            async with self._session.get(
+                self._url, headers=headers, timeout=self._timeout
+            ) as response:
+                if response.status == HTTPStatus.NOT_MODIFIED:
+                    return False
+                raw = await response.read()
+                etag = response.headers.get(hdrs.ETAG)
+
+            data = _decoder.decode(raw)
+
+            if data.status is None:
+                self._current = data.fact
+                forecast = data.forecast
+                self._forecast = forecast.parts if forecast else None
+                self._etag = etag
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Current data:%s", self._current)
+                    _LOGGER.debug("Forecast data:%s", self._forecast)
+                return True
+
+            _LOGGER.error(
+                "Error fetching data from Yandex.Weather, %s, %s",
+                data.status,
+                data.message,
+            )
+
+        except msgspec.ValidationError as error:
+            _LOGGER.error("Unexpected payload shape from Yandex.Weather, %s", error)
+        except msgspec.DecodeError as error:
+            _LOGGER.error("Invalid JSON received from Yandex.Weather, %s", error)
         except (asyncio.TimeoutError, aiohttp.ClientError, socket.gaierror) as error:
             _LOGGER.error("Error fetching data from Yandex.Weather, %s", error)
 
+        return False
+
     @property
     def forecast(self):
-        """Return forecast"""
+        """Return forecast parts"""
         return self._forecast
 
     @property